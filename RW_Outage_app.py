@@ -1,6 +1,8 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
+import hmac
 import os
 import sys
 from typing import Optional, Dict, Any
@@ -11,6 +13,8 @@ from plotly.subplots import make_subplots
 import time
 from io import BytesIO
 import base64
+import pyarrow as pa
+import pyarrow.csv as pacsv
 warnings.filterwarnings('ignore')
 
 # Check for required dependencies
@@ -44,9 +48,19 @@ except ImportError:
 # Config
 # ----------------------------
 EXCEL_FILE = "RW_Outage.xlsx"
+PARQUET_CACHE = "RW_Outage.parquet"  # columnar sidecar; the workbook stays the source of truth
 SHEET_NAME = "Downtime Log"
 SUMMARY_SHEET = "Summary"
 BROADCAST_HOURS_PER_DAY = 17.5  # 4:30 AM to 10:00 PM
+BROADCAST_MINUTES_PER_DAY = int(BROADCAST_HOURS_PER_DAY * 60)
+YEARLY_BROADCAST_MINUTES = 365 * BROADCAST_MINUTES_PER_DAY
+
+# Widget option lists (module-level so reruns don't rebuild them)
+FAILURE_TYPES = ("Power", "Transmitter", "Link", "Antenna", "Audio", "Other")
+FAILURE_TYPE_INDEX = {failure_type: i for i, failure_type in enumerate(FAILURE_TYPES)}
+YEAR_FILTER_OPTIONS = ("All", *range(2020, 2030))
+MONTH_FILTER_OPTIONS = ("All", "January", "February", "March", "April", "May", "June",
+                        "July", "August", "September", "October", "November", "December")
 
 # ----------------------------
 # Validation functions
@@ -84,36 +98,92 @@ def check_duplicate_entry(df, date, start_time, end_time) -> bool:
     """Check if an entry with the same date and time already exists."""
     if df.empty:
         return False
-    
-    df_copy = df.copy()
-    df_copy['Date'] = pd.to_datetime(df_copy['Date'])
-    target_date = pd.to_datetime(date)
-    
-    same_date_entries = df_copy[df_copy['Date'].dt.date == target_date.date()]
-    
-    for _, row in same_date_entries.iterrows():
-        existing_start = pd.to_datetime(str(row['Start Time'])).time()
-        existing_end = pd.to_datetime(str(row['End Time'])).time()
-        
-        # Check for overlap
-        if (start_time < existing_end and end_time > existing_start):
-            return True
-    return False
+
+    dates = pd.to_datetime(df['Date'], errors='coerce')
+    same_date_entries = df[dates.dt.date == pd.to_datetime(date).date()]
+    if same_date_entries.empty:
+        return False
+
+    # Compare the minutes-of-day columns precomputed in load_data
+    existing_start_min = same_date_entries['Start_min']
+    existing_end_min = same_date_entries['End_min']
+
+    new_start_min = start_time.hour * 60 + start_time.minute
+    new_end_min = end_time.hour * 60 + end_time.minute
+
+    # Check for overlap
+    overlap = (existing_start_min < new_end_min) & (existing_end_min > new_start_min)
+    return bool(overlap.any())
 
 # ----------------------------
 # Helper functions
 # ----------------------------
 
+def format_downtime(minutes):
+    """Format downtime minutes as 'Xh Ym' (or 'Ym' under an hour) for a
+    whole array in vector ops instead of a per-row f-string loop."""
+    hours, mins = np.divmod(np.asarray(minutes, dtype=np.int64), 60)
+    mins_str = np.char.add(mins.astype(str), 'm')
+    hours_str = np.char.add(hours.astype(str), 'h ')
+    return np.where(hours > 0, np.char.add(hours_str, mins_str), mins_str)
+
 @st.cache_data(ttl=600)  # Cache for 10 minutes
 def load_data():
     """Load data from Excel file with proper error handling."""
     if os.path.exists(EXCEL_FILE):
+        # A Parquet sidecar written after each parse preserves every derived
+        # dtype (categoricals, int16 minutes, datetimes), so loads skip the
+        # Excel parse entirely until the workbook is newer than the cache.
+        if (os.path.exists(PARQUET_CACHE)
+                and os.path.getmtime(PARQUET_CACHE) >= os.path.getmtime(EXCEL_FILE)):
+            try:
+                return pd.read_parquet(PARQUET_CACHE, engine='pyarrow')
+            except Exception:
+                pass  # unreadable cache — fall through to the Excel parse
         try:
-            df = pd.read_excel(EXCEL_FILE, sheet_name=SHEET_NAME)
+            # Read-only mode streams cell values instead of loading the full
+            # workbook DOM, keeping memory flat no matter how big the log gets.
+            wb = openpyxl.load_workbook(EXCEL_FILE, read_only=True, data_only=True, keep_links=False)
+            try:
+                rows = wb[SHEET_NAME].values
+                columns = next(rows, None)
+                if columns is None:
+                    return create_empty_dataframe()
+                df = pd.DataFrame(rows, columns=columns)
+            finally:
+                wb.close()
+            # ws.values yields fully-blank trailing rows that pd.read_excel
+            # used to drop; keep that behavior
+            df = df.dropna(how='all')
             # Ensure proper data types
             df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
             # Sort by date in descending order (newest first)
             df = df.sort_values('Date', ascending=False).reset_index(drop=True)
+            # Parse the time columns once and keep minutes-of-day around so
+            # downstream checks and charts never re-parse them per row
+            start_parsed = pd.to_datetime(df['Start Time'].astype(str), errors='coerce')
+            end_parsed = pd.to_datetime(df['End Time'].astype(str), errors='coerce')
+            df['Start_min'] = (start_parsed.dt.hour * 60 + start_parsed.dt.minute).fillna(-1).astype('int16')
+            df['End_min'] = (end_parsed.dt.hour * 60 + end_parsed.dt.minute).fillna(-1).astype('int16')
+            df['Downtime_hours'] = (df['Downtime (minutes)'] / 60.0).astype('float32')
+            # Rebuild the display string in one vector op so it always
+            # matches the minutes column, whatever the workbook stored
+            df['Downtime (hh:mm)'] = format_downtime(df['Downtime (minutes)'].fillna(0))
+            # Low-cardinality column — category codes make groupbys hash
+            # small ints. Union with FAILURE_TYPES so form edits (and any
+            # legacy values already in the log) always fit the categories.
+            categories = list(dict.fromkeys([*FAILURE_TYPES, *df['Failure Type'].dropna().unique()]))
+            df['Failure Type'] = pd.Categorical(df['Failure Type'], categories=categories)
+            # Year/month filter keys precomputed once; the filters compare
+            # small ints and category codes instead of decoding datetimes
+            # or strftime'ing every row per rerun
+            df['Year'] = df['Date'].dt.year.fillna(-1).astype('int16')
+            df['Month'] = pd.Categorical(df['Date'].dt.month_name(),
+                                         categories=MONTH_FILTER_OPTIONS[1:], ordered=True)
+            try:
+                df.to_parquet(PARQUET_CACHE, engine='pyarrow', compression='zstd')
+            except Exception:
+                pass  # cache is best-effort; next load just re-parses
             return df
         except FileNotFoundError:
             st.error(f"Excel file '{EXCEL_FILE}' not found.")
@@ -135,27 +205,54 @@ def create_empty_dataframe():
         "Failure Type", "Remarks"
     ])
 
+# Derived columns added by load_data; kept out of the workbook and exports
+HELPER_COLUMNS = ("Start_min", "End_min", "Downtime_hours", "Year", "Month")
+
+def drop_helper_columns(df):
+    """Return df without the derived analytics columns added by load_data."""
+    return df.drop(columns=[c for c in HELPER_COLUMNS if c in df.columns])
+
+def write_sheet(wb, title, frame):
+    """Append a DataFrame as a new sheet of a write-only workbook."""
+    ws = wb.create_sheet(title)
+    ws.append(list(frame.columns))
+    for row in frame.itertuples(index=False, name=None):
+        ws.append([None if pd.isna(value) else value for value in row])
+
 def save_data(df):
     """Save data to Excel with comprehensive summary calculations."""
     try:
-        with pd.ExcelWriter(EXCEL_FILE, engine="openpyxl", mode="w") as writer:
-            df.to_excel(writer, sheet_name=SHEET_NAME, index=False)
+        # Write-only mode streams rows straight to disk instead of building
+        # the full openpyxl cell tree, so saves stay fast as the log grows.
+        wb = openpyxl.Workbook(write_only=True)
+        write_sheet(wb, SHEET_NAME, drop_helper_columns(df))
 
-            if not df.empty:
-                # Build comprehensive summary
-                summary_data = build_comprehensive_summary(df)
-                
-                # Save monthly summary
-                summary_data['monthly'].to_excel(writer, sheet_name="Monthly_Summary", index=False)
-                
-                # Save yearly summary
-                summary_data['yearly'].to_excel(writer, sheet_name="Yearly_Summary", index=False)
-                
-                # Save detailed summary (backward compatibility)
-                summary_data['monthly'].to_excel(writer, sheet_name=SUMMARY_SHEET, index=False)
-                
-        # Clear cache after saving
-        load_data.clear()
+        if not df.empty:
+            # Build comprehensive summary. Drop the cached entry first: the
+            # fingerprint (row count, latest date, downtime sum) can collide
+            # with the pre-edit frame — e.g. moving a non-latest record to
+            # another month — and the workbook must never inherit stale
+            # summary sheets from a cache hit.
+            build_comprehensive_summary.clear()
+            summary_data = build_comprehensive_summary(df)
+
+            # Save monthly summary
+            write_sheet(wb, "Monthly_Summary", summary_data['monthly'])
+
+            # Save yearly summary
+            write_sheet(wb, "Yearly_Summary", summary_data['yearly'])
+
+            # Save detailed summary (backward compatibility)
+            write_sheet(wb, SUMMARY_SHEET, summary_data['monthly'])
+
+        # Write to a sidecar file and swap it in atomically so a crash
+        # mid-save can never leave a truncated workbook behind
+        temp_file = EXCEL_FILE + ".tmp"
+        wb.save(temp_file)
+        os.replace(temp_file, EXCEL_FILE)
+
+        # Clear caches after saving
+        clear_caches()
         return True
     except PermissionError:
         st.error(f"Permission denied. Please close '{EXCEL_FILE}' if it's open in another program.")
@@ -164,79 +261,237 @@ def save_data(df):
         st.error(f"Error saving data: {str(e)}")
         return False
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+def clear_caches():
+    """Drop every cached view of the log after a write.
+
+    The fingerprint-keyed caches can miss edits that leave row count,
+    latest date and total downtime unchanged (e.g. a remarks fix), so
+    writes clear them all explicitly.
+    """
+    load_data.clear()
+    build_comprehensive_summary.clear()
+    compute_ytd.clear()
+    analytics_frame.clear()
+
+def summary_fingerprint(df):
+    """Cheap cache key for the log frame — avoids hashing every cell."""
+    if df.empty:
+        return (0,)
+    # Coerce first — freshly appended rows can hold plain date objects
+    latest = pd.to_datetime(df['Date'], errors='coerce').max()
+    return (len(df), str(latest), float(df['Downtime (minutes)'].sum()))
+
+def append_row(record):
+    """Append a single record to the log sheet without rewriting the workbook.
+
+    The summary sheets are intentionally left untouched — the app always
+    computes summaries in memory, and the workbook copies are refreshed on
+    the next full save_data (edits, deletes, month rollover).
+    """
+    try:
+        wb = openpyxl.load_workbook(EXCEL_FILE)
+        ws = wb[SHEET_NAME]
+        # Follow the sheet's own header order in case it differs from ours
+        header = [cell.value for cell in ws[1]]
+        ws.append([record.get(column) for column in header])
+        temp_file = EXCEL_FILE + ".tmp"
+        wb.save(temp_file)
+        os.replace(temp_file, EXCEL_FILE)
+
+        # Clear caches after saving
+        clear_caches()
+        return True
+    except PermissionError:
+        st.error(f"Permission denied. Please close '{EXCEL_FILE}' if it's open in another program.")
+        return False
+    except Exception as e:
+        st.error(f"Error saving data: {str(e)}")
+        return False
+
+@st.cache_data(ttl=600, hash_funcs={pd.DataFrame: summary_fingerprint})
+def analytics_frame(df):
+    """Narrow, typed view of the log for the analytics aggregations.
+
+    Scans over this frame touch a few bytes per row instead of dragging the
+    wide object columns (Remarks, time strings) through memory.
+    """
+    return pd.DataFrame({
+        'date': df['Date'].dt.normalize(),
+        'year': df['Year'],
+        'month': df['Month'],
+        'start_min': df['Start_min'],
+        'start_hour': (df['Start_min'] // 60).astype('int8'),
+        # Blank downtime cells come through as NaN; count them as zero
+        # minutes rather than refusing the int cast
+        'downtime_min': df['Downtime (minutes)'].fillna(0).astype('int32'),
+        'downtime_hours': df['Downtime_hours'].fillna(0),
+        'failure_type': pd.Categorical(df['Failure Type'])
+    })
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def csv_bytes(frame):
+    """Serialize a frame to CSV bytes with pyarrow's writer — avoids
+    pandas' row-by-row CSV path and is cached so repeated download-button
+    reruns don't re-serialize the same frame. Falls back to pandas if the
+    frame holds cells Arrow can't convert (e.g. mixed-type columns from
+    older workbooks), so an odd value never breaks the download."""
+    try:
+        buf = BytesIO()
+        pacsv.write_csv(pa.Table.from_pandas(frame, preserve_index=False), buf)
+        return buf.getvalue()
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return frame.to_csv(index=False).encode('utf-8')
+
+def bincount_sum(keys, values, k):
+    """Count and sum ``values`` per integer key in a single bincount pass —
+    the count+sum groupbys in Analytics reduce to exactly this."""
+    counts = np.bincount(keys, minlength=k)
+    sums = np.bincount(keys, weights=values, minlength=k)
+    return counts, sums
+
+def failure_type_analysis(frame):
+    """Aggregate count/total/average downtime and days affected per failure
+    type in one pass over the category codes via bincount, instead of four
+    separate groupby walks."""
+    codes = frame['failure_type'].cat.codes.to_numpy()
+    downtime = frame['downtime_min'].to_numpy()
+    valid = codes >= 0
+    codes, downtime = codes[valid], downtime[valid]
+
+    n_types = len(frame['failure_type'].cat.categories)
+    counts = np.bincount(codes, minlength=n_types)
+    sums = np.bincount(codes, weights=downtime, minlength=n_types)
+
+    # Unique days per type: dedupe (type, day) pairs, then count per type.
+    # NaT factorizes to -1, which would shift the pair code into the
+    # neighbouring category's bucket, so undated rows are dropped here the
+    # way the groupby dropped its NaT group.
+    day_codes, _ = pd.factorize(frame.loc[valid, 'date'])
+    dated = day_codes >= 0
+    if dated.any():
+        n_days = day_codes.max() + 1
+        pairs = np.unique(codes[dated].astype(np.int64) * n_days + day_codes[dated])
+        days = np.bincount(pairs // n_days, minlength=n_types)
+    else:
+        days = np.zeros(n_types, dtype=np.int64)
+
+    observed = counts > 0
+    return pd.DataFrame({
+        'Count': counts[observed],
+        'Total_Downtime_Min': sums[observed].round(2),
+        'Avg_Downtime_Min': (sums[observed] / counts[observed]).round(2),
+        'Days_Affected': days[observed]
+    }, index=pd.Index(frame['failure_type'].cat.categories[observed], name='Failure Type'))
+
+@st.cache_data(ttl=300, hash_funcs={pd.DataFrame: summary_fingerprint})
+def compute_ytd(df):
+    """Year-to-date availability for the sidebar badge — one masked sum
+    instead of the full monthly/yearly summary build."""
+    if df.empty:
+        return {}
+
+    now = datetime.now()
+    cutoff = pd.Timestamp(now.date()) + pd.Timedelta(days=1)
+    mask = (df['Year'] == now.year) & (df['Date'] < cutoff)
+    downtime = df.loc[mask, 'Downtime (minutes)']
+    if downtime.empty:
+        return {}
+
+    # datetime(...).date() rather than date(...): the form pages rebind the
+    # module-global `date` to the st.date_input value
+    days_elapsed = (now.date() - datetime(now.year, 1, 1).date()).days + 1
+    broadcast_minutes = days_elapsed * BROADCAST_MINUTES_PER_DAY
+    return {
+        'ytd_availability_%': (broadcast_minutes - downtime.sum()) / broadcast_minutes * 100,
+        'failure_count': len(downtime)
+    }
+
+@st.cache_data(ttl=300, show_spinner=False, hash_funcs={pd.DataFrame: summary_fingerprint})  # Cache for 5 minutes
 def build_comprehensive_summary(df):
     """Build comprehensive monthly and yearly availability summaries."""
     if df.empty:
         return {'monthly': pd.DataFrame(), 'yearly': pd.DataFrame()}
     
-    df_copy = df.copy()
-    df_copy["Date"] = pd.to_datetime(df_copy["Date"], errors="coerce")
-    df_copy = df_copy.dropna(subset=['Date'])
-    
-    if df_copy.empty:
+    # Work on a narrow frame of just the columns the aggregations touch
+    # instead of copying the whole log
+    dates = pd.to_datetime(df["Date"], errors="coerce")
+    valid = dates.notna()
+    dates = dates[valid]
+
+    if dates.empty:
         return {'monthly': pd.DataFrame(), 'yearly': pd.DataFrame()}
-    
-    df_copy["Month"] = df_copy["Date"].dt.strftime("%B")
-    df_copy["Year"] = df_copy["Date"].dt.year
-    df_copy["Month_Num"] = df_copy["Date"].dt.month
-    
+
+    work = pd.DataFrame({
+        "Date": dates,
+        "Downtime (minutes)": df.loc[valid, "Downtime (minutes)"],
+        "Failure Type": df.loc[valid, "Failure Type"],
+        "Month": dates.dt.strftime("%B"),
+        "Year": dates.dt.year,
+        "Month_Num": dates.dt.month,
+    })
+
     # Monthly Summary
-    monthly_summary = df_copy.groupby(["Year", "Month", "Month_Num"]).agg(
+    monthly_summary = work.groupby(["Year", "Month", "Month_Num"], observed=True).agg(
         Total_Downtime_Minutes=("Downtime (minutes)", "sum"),
         Failure_Count=("Failure Type", "count"),
         Avg_Downtime_Per_Failure=("Downtime (minutes)", "mean")
     ).reset_index()
     
     # Calculate monthly metrics
-    monthly_summary["Days_in_Month"] = monthly_summary.apply(
-        lambda row: pd.Period(f"{row['Year']}-{row['Month_Num']:02d}").days_in_month,
-        axis=1
+    month_periods = pd.PeriodIndex.from_fields(
+        year=monthly_summary["Year"], month=monthly_summary["Month_Num"], freq="M"
     )
-    monthly_summary["Total_Broadcast_Minutes"] = monthly_summary["Days_in_Month"] * BROADCAST_HOURS_PER_DAY * 60
+    monthly_summary["Days_in_Month"] = month_periods.days_in_month
+    monthly_summary["Total_Broadcast_Minutes"] = monthly_summary["Days_in_Month"] * BROADCAST_MINUTES_PER_DAY
     monthly_summary["Availability_%"] = ((monthly_summary["Total_Broadcast_Minutes"] - monthly_summary["Total_Downtime_Minutes"]) /
                                         monthly_summary["Total_Broadcast_Minutes"]) * 100
     
     # Sort by year and month
     monthly_summary = monthly_summary.sort_values(["Year", "Month_Num"]).drop("Month_Num", axis=1)
     
-    # Yearly Summary
-    yearly_summary = df_copy.groupby(["Year"]).agg(
-        Total_Downtime_Minutes=("Downtime (minutes)", "sum"),
-        Failure_Count=("Failure Type", "count"),
+    # Yearly Summary — roll the monthly totals up instead of re-scanning the
+    # raw log; only the per-record mean/extremes need one more raw pass
+    yearly_summary = monthly_summary.groupby("Year", observed=True).agg(
+        Total_Downtime_Minutes=("Total_Downtime_Minutes", "sum"),
+        Failure_Count=("Failure_Count", "sum")
+    ).reset_index()
+    yearly_extremes = work.groupby("Year", observed=True).agg(
         Avg_Downtime_Per_Failure=("Downtime (minutes)", "mean"),
         Max_Downtime=("Downtime (minutes)", "max"),
         Min_Downtime=("Downtime (minutes)", "min")
     ).reset_index()
+    yearly_summary = yearly_summary.merge(yearly_extremes, on="Year")
     
     # Calculate yearly metrics
-    yearly_summary["Days_in_Year"] = yearly_summary["Year"].apply(
-        lambda year: 366 if pd.Period(f"{year}").is_leap_year else 365
-    )
-    yearly_summary["Total_Broadcast_Minutes"] = yearly_summary["Days_in_Year"] * BROADCAST_HOURS_PER_DAY * 60
+    year_periods = pd.PeriodIndex(yearly_summary["Year"].astype(str), freq="Y")
+    yearly_summary["Days_in_Year"] = year_periods.is_leap_year.astype(int) + 365
+    yearly_summary["Total_Broadcast_Minutes"] = yearly_summary["Days_in_Year"] * BROADCAST_MINUTES_PER_DAY
     yearly_summary["Availability_%"] = ((yearly_summary["Total_Broadcast_Minutes"] - yearly_summary["Total_Downtime_Minutes"]) /
                                        yearly_summary["Total_Broadcast_Minutes"]) * 100
     yearly_summary["Max_Downtime_hours"] = yearly_summary["Max_Downtime"] / 60
     yearly_summary["Min_Downtime_hours"] = yearly_summary["Min_Downtime"] / 60
     
     # Calculate Year-to-Date (YTD) availability for current year
-    current_year = datetime.now().year
-    current_date = datetime.now().date()
+    now = datetime.now()
+    current_year = now.year
+    current_date = now.date()
     
     # Get all outages from January 1st of current year to today
-    ytd_outages = df_copy[
-        (df_copy['Date'].dt.year == current_year) & 
-        (df_copy['Date'].dt.date <= current_date)
+    ytd_outages = work[
+        (work['Year'] == current_year) &
+        (work['Date'].dt.date <= current_date)
     ]
     
     ytd_summary = {}
     if not ytd_outages.empty:
-        # Calculate days from Jan 1 to current date
+        # Calculate days from Jan 1 to current date. Built via datetime
+        # because the form pages rebind `date` to their st.date_input value
+        # before the save path reaches this function.
         jan_1 = datetime(current_year, 1, 1).date()
         days_elapsed = (current_date - jan_1).days + 1
         
         # Calculate total broadcast minutes for YTD period
-        total_ytd_broadcast_minutes = days_elapsed * BROADCAST_HOURS_PER_DAY * 60
+        total_ytd_broadcast_minutes = days_elapsed * BROADCAST_MINUTES_PER_DAY
         
         # Calculate total downtime for YTD period
         total_ytd_downtime_minutes = ytd_outages['Downtime (minutes)'].sum()
@@ -255,23 +510,34 @@ def build_comprehensive_summary(df):
             'avg_downtime_per_failure': ytd_outages['Downtime (minutes)'].mean() if len(ytd_outages) > 0 else 0
         }
     
-    return {'monthly': monthly_summary, 'yearly': yearly_summary, 'ytd': ytd_summary}
+    failure_counts = df['Failure Type'].value_counts()
+
+    return {
+        'monthly': monthly_summary,
+        'yearly': yearly_summary,
+        'ytd': ytd_summary,
+        'failure_counts': failure_counts[failure_counts > 0]
+    }
 
 # ----------------------------
 # Chart Helper Functions
 # ----------------------------
 
-def create_availability_chart(monthly_data):
-    """Create an interactive availability trend chart."""
-    if monthly_data.empty:
+# Layout settings shared by every chart; built once per script run
+BASE_LAYOUT = dict(template='plotly_white', height=400)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def create_availability_chart(months, values):
+    """Create the availability trend chart, cached on plain-tuple inputs."""
+    if not months:
         return None
-    
+
     fig = go.Figure()
-    
-    # Add availability line
-    fig.add_trace(go.Scatter(
-        x=monthly_data['Month'],
-        y=monthly_data['Availability_%'],
+
+    # Add availability line (WebGL trace stays responsive on large histories)
+    fig.add_trace(go.Scattergl(
+        x=np.asarray(months),
+        y=np.asarray(values, dtype='float32'),
         mode='lines+markers',
         name='Availability %',
         line=dict(color='#1f77b4', width=3),
@@ -293,23 +559,23 @@ def create_availability_chart(monthly_data):
         xaxis_title="Month",
         yaxis_title="Availability (%)",
         hovermode='x unified',
-        template='plotly_white',
-        height=400,
-        showlegend=True
+        showlegend=True,
+        **BASE_LAYOUT
     )
     
     return fig
 
-def create_failure_analysis_chart(failure_data):
-    """Create an interactive failure type analysis chart."""
-    if failure_data.empty:
+@st.cache_data(max_entries=32, show_spinner=False)
+def create_failure_analysis_chart(failure_types, counts):
+    """Create the failure type analysis chart, cached on plain-tuple inputs."""
+    if not failure_types:
         return None
-    
+
     fig = go.Figure()
-    
+
     fig.add_trace(go.Bar(
-        x=failure_data.index,
-        y=failure_data['Count'],
+        x=np.asarray(failure_types),
+        y=np.asarray(counts, dtype='int32'),
         name='Failure Count',
         marker_color='#ff7f0e',
         hovertemplate='<b>%{x}</b><br>Count: %{y}<extra></extra>'
@@ -319,23 +585,23 @@ def create_failure_analysis_chart(failure_data):
         title="Failure Type Distribution",
         xaxis_title="Failure Type",
         yaxis_title="Count",
-        template='plotly_white',
-        height=400,
-        showlegend=False
+        showlegend=False,
+        **BASE_LAYOUT
     )
     
     return fig
 
-def create_downtime_trend_chart(daily_data):
-    """Create an interactive daily downtime trend chart."""
-    if daily_data.empty:
+@st.cache_data(max_entries=32, show_spinner=False)
+def create_downtime_trend_chart(dates, hours):
+    """Create the daily downtime trend chart, cached on plain-tuple inputs."""
+    if not dates:
         return None
-    
+
     fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=daily_data.index,
-        y=daily_data['Daily_Downtime_Hours'],
+
+    fig.add_trace(go.Scattergl(
+        x=np.asarray(dates),
+        y=np.asarray(hours, dtype='float32'),
         mode='lines+markers',
         name='Daily Downtime (Hours)',
         line=dict(color='#d62728', width=2),
@@ -348,16 +614,41 @@ def create_downtime_trend_chart(daily_data):
         xaxis_title="Date",
         yaxis_title="Downtime (Hours)",
         hovermode='x unified',
-        template='plotly_white',
-        height=400,
-        showlegend=True
+        showlegend=True,
+        **BASE_LAYOUT
     )
     
     return fig
 
-def create_hourly_analysis_chart(hourly_data):
-    """Create an interactive hourly outage analysis chart."""
-    if hourly_data.empty:
+@st.cache_data(max_entries=32, show_spinner=False)
+def create_daily_failures_chart(dates, counts):
+    """Create the daily failure count chart, cached on plain-tuple inputs."""
+    fig = go.Figure()
+
+    fig.add_trace(go.Scattergl(
+        x=np.asarray(dates),
+        y=np.asarray(counts, dtype='int32'),
+        mode='lines+markers',
+        name='Daily Failures',
+        line=dict(color='#2ca02c', width=2),
+        marker=dict(size=6),
+        hovertemplate='<b>%{x}</b><br>Failures: %{y}<extra></extra>'
+    ))
+
+    fig.update_layout(
+        title="Daily Failure Count",
+        xaxis_title="Date",
+        yaxis_title="Failure Count",
+        showlegend=False,
+        **BASE_LAYOUT
+    )
+
+    return fig
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def create_hourly_analysis_chart(hours, counts, downtime_min):
+    """Create the hourly outage analysis chart, cached on plain-tuple inputs."""
+    if not hours:
         return None
     
     fig = make_subplots(
@@ -369,8 +660,8 @@ def create_hourly_analysis_chart(hourly_data):
     # Outage count chart
     fig.add_trace(
         go.Bar(
-            x=hourly_data.index,
-            y=hourly_data['Count'],
+            x=np.asarray(hours, dtype='int16'),
+            y=np.asarray(counts, dtype='int32'),
             name='Outage Count',
             marker_color='#2ca02c',
             hovertemplate='<b>Hour %{x}</b><br>Count: %{y}<extra></extra>'
@@ -381,8 +672,8 @@ def create_hourly_analysis_chart(hourly_data):
     # Downtime chart
     fig.add_trace(
         go.Bar(
-            x=hourly_data.index,
-            y=hourly_data['Total_Downtime_Min'],
+            x=np.asarray(hours, dtype='int16'),
+            y=np.asarray(downtime_min, dtype='float32'),
             name='Total Downtime (min)',
             marker_color='#17a2b8',
             hovertemplate='<b>Hour %{x}</b><br>Downtime: %{y:.1f} min<extra></extra>'
@@ -392,9 +683,8 @@ def create_hourly_analysis_chart(hourly_data):
     
     fig.update_layout(
         title="Hourly Outage Analysis",
-        template='plotly_white',
-        height=600,
-        showlegend=False
+        showlegend=False,
+        **{**BASE_LAYOUT, "height": 600}
     )
     
     fig.update_xaxes(title_text="Hour of Day", row=2, col=1)
@@ -676,6 +966,7 @@ def create_pdf_report(df, summary_data, report_type="complete"):
             
             # Add failure type counts
             failure_counts = df['Failure Type'].value_counts()
+            failure_counts = failure_counts[failure_counts > 0]
             for failure_type, count in failure_counts.items():
                 summary_data_table.append([f"{failure_type} Failures", str(count)])
             
@@ -711,8 +1002,8 @@ def create_pdf_report(df, summary_data, report_type="complete"):
                 
                 # Filter outages for the latest month
                 outages_df = df[
-                    (df['Date'].dt.year == latest_year) & 
-                    (df['Date'].dt.strftime('%B') == latest_month_name)
+                    (df['Year'] == latest_year) &
+                    (df['Month'] == latest_month_name)
                 ].copy()
                 
                 story.append(Paragraph(f"All Outages from {latest_month_name} {latest_year}", styles['Heading2']))
@@ -775,7 +1066,7 @@ def check_password():
     
     def password_entered():
         """Checks whether a password entered by the user is correct."""
-        if st.session_state["password"] == "technical":
+        if hmac.compare_digest(st.session_state["password"], "technical"):
             st.session_state["password_correct"] = True
             del st.session_state["password"]  # don't store password
         else:
@@ -816,13 +1107,14 @@ st.set_page_config(
     }
 )
 
-# Load custom CSS
-load_custom_css()
-
-# Check password before showing the main application
+# Check password before doing any other work — unauthenticated reruns
+# shouldn't pay for the CSS payload or the header markup
 if not check_password():
     st.stop()  # Do not continue if check_password is not True.
 
+# Load custom CSS
+load_custom_css()
+
 # Modern header with gradient background
 st.markdown("""
 <div class="main-header">
@@ -852,9 +1144,8 @@ df = load_data()
 
 if not df.empty:
     # Calculate current system health
-    summary_data = build_comprehensive_summary(df)
-    ytd_summary = summary_data['ytd']
-    
+    ytd_summary = compute_ytd(df)
+
     if ytd_summary:
         availability = ytd_summary['ytd_availability_%']
         if availability >= 99.5:
@@ -892,11 +1183,8 @@ st.sidebar.markdown(
 # Add search and filter options in sidebar
 if menu in ["✏️ Edit Records", "📊 View Summary", "📈 Analytics Dashboard"]:
     st.sidebar.markdown("### 🔍 Filters")
-    year_filter = st.sidebar.selectbox("Filter by Year", ["All"] + list(range(2020, 2030)))
-    month_filter = st.sidebar.selectbox("Filter by Month", ["All"] + [
-        "January", "February", "March", "April", "May", "June",
-        "July", "August", "September", "October", "November", "December"
-    ])
+    year_filter = st.sidebar.selectbox("Filter by Year", YEAR_FILTER_OPTIONS)
+    month_filter = st.sidebar.selectbox("Filter by Month", MONTH_FILTER_OPTIONS)
 
 # ----------------------------
 # Log Outage Page
@@ -935,7 +1223,7 @@ if menu == "📝 Log Outage":
             )
             failure_type = st.selectbox(
                 "🔧 Failure Type", 
-                ["Power", "Transmitter", "Link", "Antenna", "Audio", "Other"],
+                FAILURE_TYPES,
                 help="Select the primary cause of the outage"
             )
         
@@ -963,7 +1251,7 @@ if menu == "📝 Log Outage":
             end_dt = datetime.combine(date, end_time)
             downtime_minutes = int((end_dt - start_dt).total_seconds() / 60)
             hours, minutes = divmod(downtime_minutes, 60)
-            downtime_str = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
+            downtime_str = f"{hours}h {minutes}m" if hours else f"{minutes}m"
             
             # Color code the downtime preview
             if downtime_minutes <= 30:
@@ -992,8 +1280,10 @@ if menu == "📝 Log Outage":
                         # Create new record
                         new_record = {
                             "Date": date,
-                            "Start Time": start_time,
-                            "End Time": end_time,
+                            # Stored as text to match the sheet's existing
+                            # cells (the edit path writes str(...) too)
+                            "Start Time": str(start_time),
+                            "End Time": str(end_time),
                             "Downtime (minutes)": downtime_minutes,
                             "Downtime (hh:mm)": downtime_str,
                             "Failure Type": failure_type,
@@ -1002,11 +1292,21 @@ if menu == "📝 Log Outage":
 
                         # Show progress indicator
                         with st.spinner("💾 Saving outage data..."):
-                            df = pd.concat([df, pd.DataFrame([new_record])], ignore_index=True)
-                            if save_data(df):
+                            latest_date = df['Date'].max() if not df.empty else pd.NaT
+                            if pd.isna(latest_date) or (latest_date.year, latest_date.month) != (date.year, date.month):
+                                # First record of a new month (or of the log) —
+                                # full save so the summary sheets roll over too.
+                                # In-place row append beats a full-frame concat;
+                                # load_data hands out fresh copies, so mutating
+                                # here is safe.
+                                df.loc[len(df)] = pd.Series(new_record)
+                                saved = save_data(df)
+                            else:
+                                saved = append_row(new_record)
+                            if saved:
                                 st.success("New outage record has been created successfully.")
-                                # Clear cache and refresh data
-                                load_data.clear()
+                                # Clear caches and refresh data
+                                clear_caches()
                                 # Add a delay to show the message before refresh
                                 time.sleep(2)
                                 st.rerun()
@@ -1022,17 +1322,18 @@ elif menu == "✏️ Edit Records":
     if df.empty:
         st.info("📭 No records found. Log some outages first!")
     else:
-        # Apply filters
-        filtered_df = df.copy()
+        # Apply filters; boolean indexing below already materializes new
+        # frames, so no up-front copy of the full log is needed
+        filtered_df = df
         if year_filter != "All":
-            filtered_df = filtered_df[filtered_df['Date'].dt.year == year_filter]
+            filtered_df = filtered_df[filtered_df['Year'] == year_filter]
         if month_filter != "All":
-            filtered_df = filtered_df[filtered_df['Date'].dt.strftime('%B') == month_filter]
+            filtered_df = filtered_df[filtered_df['Month'] == month_filter]
         
         st.markdown(f"**Total Records:** {len(filtered_df)} (Filtered from {len(df)} total)")
         
         # Enhanced dataframe display with formatted date
-        filtered_df_display = filtered_df.copy()
+        filtered_df_display = drop_helper_columns(filtered_df)
         filtered_df_display['Date'] = filtered_df_display['Date'].dt.strftime('%Y-%m-%d')
         st.dataframe(
             filtered_df_display, 
@@ -1079,8 +1380,8 @@ elif menu == "✏️ Edit Records":
                         date = st.date_input("📅 Date", value=selected_record['Date'].date())
                         failure_type = st.selectbox(
                             "🔧 Failure Type", 
-                            ["Power", "Transmitter", "Link", "Antenna", "Audio", "Other"],
-                            index=["Power", "Transmitter", "Link", "Antenna", "Audio", "Other"].index(selected_record['Failure Type']) if selected_record['Failure Type'] in ["Power", "Transmitter", "Link", "Antenna", "Audio", "Other"] else 0
+                            FAILURE_TYPES,
+                            index=FAILURE_TYPE_INDEX.get(selected_record['Failure Type'], 0)
                         )
                     
                     with col2:
@@ -1112,26 +1413,28 @@ elif menu == "✏️ Edit Records":
                                 end_dt = datetime.combine(date, end_time)
                                 downtime_minutes = int((end_dt - start_dt).total_seconds() / 60)
                                 hours, minutes = divmod(downtime_minutes, 60)
-                                downtime_str = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
+                                downtime_str = f"{hours}h {minutes}m" if hours else f"{minutes}m"
 
-                                # Find the actual index in the original dataframe
-                                actual_index = df.index[df.index == filtered_df.index[record_index]].tolist()[0]
+                                # filtered_df keeps df's labels, so this is a direct O(1) lookup
+                                actual_index = filtered_df.index[record_index]
                                 
-                                # Update the record with correct field mapping
-                                df.loc[actual_index, 'Date'] = date
-                                df.loc[actual_index, 'Start Time'] = start_time
-                                df.loc[actual_index, 'End Time'] = end_time
-                                df.loc[actual_index, 'Downtime (minutes)'] = downtime_minutes
-                                df.loc[actual_index, 'Downtime (hh:mm)'] = downtime_str
-                                df.loc[actual_index, 'Failure Type'] = failure_type
-                                df.loc[actual_index, 'Remarks'] = remarks
+                                # Update the record in one indexing call
+                                updates = {
+                                    'Date': pd.Timestamp(date),
+                                    'Start Time': str(start_time),
+                                    'End Time': str(end_time),
+                                    'Downtime (minutes)': downtime_minutes,
+                                    'Downtime (hh:mm)': downtime_str,
+                                    'Failure Type': failure_type,
+                                    'Remarks': remarks
+                                }
+                                df.loc[actual_index, list(updates)] = list(updates.values())
                                 
                                 if save_data(df):
-                                    st.success("Record has been updated successfully.")
-                                    # Clear cache and refresh data
-                                    load_data.clear()
-                                    # Add a delay to show the message before refresh
-                                    time.sleep(2)
+                                    # Toast survives the rerun, so no need to
+                                    # block the server thread to show it
+                                    st.toast("Record has been updated successfully.", icon="💾")
+                                    clear_caches()
                                     st.rerun()
                                 else:
                                     st.error("Unable to update record. Please check your input and try again.")
@@ -1141,16 +1444,16 @@ elif menu == "✏️ Edit Records":
                 st.warning("Are you sure you want to delete this record? This action cannot be undone.")
                 
                 if st.button("🗑️ Confirm Delete", type="primary"):
-                    # Find the actual index in the original dataframe
-                    actual_index = df.index[df.index == filtered_df.index[record_index]].tolist()[0]
-                    df = df.drop(actual_index).reset_index(drop=True)
+                    # filtered_df keeps df's labels, so this is a direct O(1) lookup
+                    actual_index = filtered_df.index[record_index]
+                    # Single mask-take instead of drop + reindex copying twice
+                    keep = np.ones(len(df), dtype=bool)
+                    keep[df.index.get_loc(actual_index)] = False
+                    df = df.iloc[keep].reset_index(drop=True)
                     
                     if save_data(df):
-                        st.success("Record has been deleted successfully.")
-                        # Clear cache and refresh data
-                        load_data.clear()
-                        # Add a delay to show the message before refresh
-                        time.sleep(2)
+                        st.toast("Record has been deleted successfully.", icon="🗑️")
+                        clear_caches()
                         st.rerun()
                     else:
                         st.error("Unable to delete record. Please try again.")
@@ -1169,7 +1472,13 @@ elif menu == "📊 View Summary":
         monthly_summary = summary_data['monthly']
         yearly_summary = summary_data['yearly']
         ytd_summary = summary_data['ytd']
-        
+
+        # Format the YTD availability metric once; the same value/delta
+        # pair is shown in both the KPI and Yearly Summary sections
+        if ytd_summary:
+            ytd_avail = ytd_summary['ytd_availability_%']
+            ytd_delta = None if ytd_avail == 99 else f"{ytd_avail - 99:.2f}%"
+
         # Apply filters
         if year_filter != "All":
             monthly_summary = monthly_summary[monthly_summary['Year'] == year_filter]
@@ -1187,8 +1496,8 @@ elif menu == "📊 View Summary":
             with col1:
                 st.metric(
                     "YTD Availability", 
-                    f"{ytd_summary['ytd_availability_%']:.2f}%",
-                    delta=f"{ytd_summary['ytd_availability_%'] - 99:.2f}%" if ytd_summary['ytd_availability_%'] != 99 else None,
+                    f"{ytd_avail:.2f}%",
+                    delta=ytd_delta,
                     help=f"Availability from Jan 1, {ytd_summary['current_year']} to today"
                 )
             with col2:
@@ -1214,31 +1523,45 @@ elif menu == "📊 View Summary":
         # Month to Date Performance
         if not monthly_summary.empty:
             st.markdown("#### 📅 Month to Date Performance")
-            latest_month = monthly_summary.iloc[-1]
+            # Pull the three scalars in one numpy extraction instead of
+            # boxing the last row into a Series and indexing it repeatedly
+            mtd_avail, mtd_failures, mtd_downtime = monthly_summary[
+                ['Availability_%', 'Failure_Count', 'Total_Downtime_Minutes']
+            ].to_numpy()[-1]
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Month to Date Availability", f"{latest_month['Availability_%']:.2f}%", 
-                         delta=f"{latest_month['Availability_%'] - 99:.2f}%" if latest_month['Availability_%'] != 99 else None)
+                st.metric("Month to Date Availability", f"{mtd_avail:.2f}%",
+                         delta=f"{mtd_avail - 99:.2f}%" if mtd_avail != 99 else None)
             with col2:
-                st.metric("Month to Date Failures", int(latest_month['Failure_Count']))
+                st.metric("Month to Date Failures", int(mtd_failures))
             with col3:
-                st.metric("Month to Date Downtime", f"{latest_month['Total_Downtime_Minutes'] / 60:.1f}h")
+                st.metric("Month to Date Downtime", f"{mtd_downtime / 60:.1f}h")
         
         # Monthly Summary
         st.markdown("### 📅 Monthly Summary")
         if not monthly_summary.empty:
             # Show all monthly data
             st.markdown("#### 📊 All Monthly Data")
-            display_monthly = monthly_summary.copy()
-            display_monthly['Availability_%'] = display_monthly['Availability_%'].round(2)
-            display_monthly['Total_Downtime_Minutes'] = display_monthly['Total_Downtime_Minutes'].astype(int)
-            display_monthly['Total_Downtime_Hours'] = (display_monthly['Total_Downtime_Minutes'] / 60).round(1)
-            
-            st.dataframe(display_monthly, use_container_width=True)
+            # Round/cast in the browser via column_config instead of
+            # building a formatted copy of the summary each rerun
+            st.dataframe(
+                monthly_summary.assign(
+                    Total_Downtime_Hours=monthly_summary['Total_Downtime_Minutes'] / 60
+                ),
+                use_container_width=True,
+                column_config={
+                    'Availability_%': st.column_config.NumberColumn(format="%.2f"),
+                    'Total_Downtime_Minutes': st.column_config.NumberColumn(format="%d"),
+                    'Total_Downtime_Hours': st.column_config.NumberColumn(format="%.1f"),
+                }
+            )
             
             # Add monthly trend chart
             st.markdown("#### 📈 Monthly Availability Trend")
-            monthly_chart = create_availability_chart(monthly_summary)
+            monthly_chart = create_availability_chart(
+                tuple(monthly_summary['Month']),
+                tuple(monthly_summary['Availability_%'])
+            )
             if monthly_chart:
                 st.plotly_chart(monthly_chart, use_container_width=True)
             else:
@@ -1258,8 +1581,8 @@ elif menu == "📊 View Summary":
             with col1:
                 st.metric(
                     "YTD Availability", 
-                    f"{ytd_summary['ytd_availability_%']:.2f}%",
-                    delta=f"{ytd_summary['ytd_availability_%'] - 99:.2f}%" if ytd_summary['ytd_availability_%'] != 99 else None
+                    f"{ytd_avail:.2f}%",
+                    delta=ytd_delta
                 )
                 st.metric("Days Elapsed", f"{ytd_summary['days_elapsed']}")
             with col2:
@@ -1271,7 +1594,7 @@ elif menu == "📊 View Summary":
                 days_remaining = 365 - ytd_summary['days_elapsed']
                 projected_remaining_downtime = (ytd_summary['total_downtime_minutes'] / ytd_summary['days_elapsed']) * days_remaining
                 projected_total_downtime = ytd_summary['total_downtime_minutes'] + projected_remaining_downtime
-                projected_availability = ((365 * BROADCAST_HOURS_PER_DAY * 60 - projected_total_downtime) / (365 * BROADCAST_HOURS_PER_DAY * 60)) * 100
+                projected_availability = ((YEARLY_BROADCAST_MINUTES - projected_total_downtime) / YEARLY_BROADCAST_MINUTES) * 100
                 
                 st.info(f"📊 **Projected Full Year Availability**: {projected_availability:.2f}% (based on current trend)")
             
@@ -1281,12 +1604,15 @@ elif menu == "📊 View Summary":
         if not yearly_summary.empty:
             st.markdown("#### 📈 Historical Yearly Data")
             # Format the dataframe for better display
-            display_yearly = yearly_summary.copy()
-            display_yearly['Availability_%'] = display_yearly['Availability_%'].round(2)
-            display_yearly['Max_Downtime_hours'] = display_yearly['Max_Downtime_hours'].round(1)
-            display_yearly['Min_Downtime_hours'] = display_yearly['Min_Downtime_hours'].round(1)
-            
-            st.dataframe(display_yearly, use_container_width=True)
+            st.dataframe(
+                yearly_summary,
+                use_container_width=True,
+                column_config={
+                    'Availability_%': st.column_config.NumberColumn(format="%.2f"),
+                    'Max_Downtime_hours': st.column_config.NumberColumn(format="%.1f"),
+                    'Min_Downtime_hours': st.column_config.NumberColumn(format="%.1f"),
+                }
+            )
         else:
             st.info("No historical yearly data available for the selected filters.")
 
@@ -1299,23 +1625,19 @@ elif menu == "📈 Analytics Dashboard":
     if df.empty:
         st.info("📭 No data available. Log some outages first!")
     else:
-        # Apply filters
-        filtered_df = df.copy()
+        # Apply filters on the narrow analytics frame
+        filtered_df = analytics_frame(df)
         if year_filter != "All":
-            filtered_df = filtered_df[filtered_df['Date'].dt.year == year_filter]
+            filtered_df = filtered_df[filtered_df['year'] == year_filter]
         if month_filter != "All":
-            filtered_df = filtered_df[filtered_df['Date'].dt.strftime('%B') == month_filter]
+            filtered_df = filtered_df[filtered_df['month'] == month_filter]
         
         if filtered_df.empty:
             st.info("No data available for the selected filters.")
         else:
             # Failure Type Analysis
             st.markdown("### 🔧 Failure Type Analysis")
-            failure_analysis = filtered_df.groupby('Failure Type').agg({
-                'Downtime (minutes)': ['count', 'sum', 'mean'],
-                'Date': 'nunique'
-            }).round(2)
-            failure_analysis.columns = ['Count', 'Total_Downtime_Min', 'Avg_Downtime_Min', 'Days_Affected']
+            failure_analysis = failure_type_analysis(filtered_df)
             failure_analysis['Total_Downtime_Hours'] = (failure_analysis['Total_Downtime_Min'] / 60).round(1)
             failure_analysis['Avg_Downtime_Hours'] = (failure_analysis['Avg_Downtime_Min'] / 60).round(1)
             
@@ -1324,7 +1646,10 @@ elif menu == "📈 Analytics Dashboard":
                 st.dataframe(failure_analysis, use_container_width=True)
             with col2:
                 st.markdown("#### 📊 Failure Distribution")
-                failure_chart = create_failure_analysis_chart(failure_analysis)
+                failure_chart = create_failure_analysis_chart(
+                    tuple(failure_analysis.index),
+                    tuple(failure_analysis['Count'])
+                )
                 if failure_chart:
                     st.plotly_chart(failure_chart, use_container_width=True)
                 else:
@@ -1332,14 +1657,25 @@ elif menu == "📈 Analytics Dashboard":
             
             # Time-based Analysis
             st.markdown("### ⏰ Time-based Analysis")
-            filtered_df['Hour'] = pd.to_datetime(filtered_df['Start Time']).dt.hour
-            hourly_analysis = filtered_df.groupby('Hour').agg({
-                'Downtime (minutes)': ['count', 'sum']
-            }).round(2)
-            hourly_analysis.columns = ['Count', 'Total_Downtime_Min']
+            hours = filtered_df['start_hour'].to_numpy()
+            valid_hours = hours >= 0
+            hour_counts, hour_sums = bincount_sum(
+                hours[valid_hours],
+                filtered_df['downtime_min'].to_numpy()[valid_hours],
+                24
+            )
+            observed_hours = hour_counts > 0
+            hourly_analysis = pd.DataFrame({
+                'Count': hour_counts[observed_hours],
+                'Total_Downtime_Min': hour_sums[observed_hours].round(2)
+            }, index=pd.Index(np.arange(24)[observed_hours], name='Hour'))
             
             st.markdown("#### 🕐 Hourly Outage Analysis")
-            hourly_chart = create_hourly_analysis_chart(hourly_analysis)
+            hourly_chart = create_hourly_analysis_chart(
+                tuple(hourly_analysis.index),
+                tuple(hourly_analysis['Count']),
+                tuple(hourly_analysis['Total_Downtime_Min'])
+            )
             if hourly_chart:
                 st.plotly_chart(hourly_chart, use_container_width=True)
             else:
@@ -1347,39 +1683,42 @@ elif menu == "📈 Analytics Dashboard":
             
             # Trend Analysis
             st.markdown("### 📈 Trend Analysis")
-            filtered_df['Date'] = pd.to_datetime(filtered_df['Date'])
-            daily_analysis = filtered_df.groupby('Date').agg({
-                'Downtime (minutes)': ['count', 'sum']
-            }).round(2)
-            daily_analysis.columns = ['Daily_Failures', 'Daily_Downtime_Min']
-            daily_analysis['Daily_Downtime_Hours'] = (daily_analysis['Daily_Downtime_Min'] / 60).round(1)
+            day_codes, day_values = pd.factorize(filtered_df['date'], sort=True)
+            # NaT factorizes to -1; mask it out like the hourly path does,
+            # matching the groupby behavior of dropping the NaT group
+            valid_days = day_codes >= 0
+            day_codes = day_codes[valid_days]
+            day_counts, day_sums = bincount_sum(
+                day_codes,
+                filtered_df['downtime_min'].to_numpy()[valid_days],
+                len(day_values)
+            )
+            day_hours = np.bincount(
+                day_codes,
+                weights=filtered_df['downtime_hours'].to_numpy()[valid_days],
+                minlength=len(day_values)
+            )
+            daily_analysis = pd.DataFrame({
+                'Daily_Failures': day_counts,
+                'Daily_Downtime_Min': day_sums.round(2),
+                'Daily_Downtime_Hours': day_hours.round(1)
+            }, index=pd.Index(day_values, name='Date'))
             
             col1, col2 = st.columns(2)
             with col1:
                 st.markdown("#### 📅 Daily Failure Count")
-                daily_failures_fig = go.Figure()
-                daily_failures_fig.add_trace(go.Scatter(
-                    x=daily_analysis.index,
-                    y=daily_analysis['Daily_Failures'],
-                    mode='lines+markers',
-                    name='Daily Failures',
-                    line=dict(color='#2ca02c', width=2),
-                    marker=dict(size=6),
-                    hovertemplate='<b>%{x}</b><br>Failures: %{y}<extra></extra>'
-                ))
-                daily_failures_fig.update_layout(
-                    title="Daily Failure Count",
-                    xaxis_title="Date",
-                    yaxis_title="Failure Count",
-                    template='plotly_white',
-                    height=400,
-                    showlegend=False
+                daily_failures_fig = create_daily_failures_chart(
+                    tuple(daily_analysis.index),
+                    tuple(daily_analysis['Daily_Failures'])
                 )
                 st.plotly_chart(daily_failures_fig, use_container_width=True)
             
             with col2:
                 st.markdown("#### ⏱️ Daily Downtime")
-                downtime_chart = create_downtime_trend_chart(daily_analysis)
+                downtime_chart = create_downtime_trend_chart(
+                    tuple(daily_analysis.index),
+                    tuple(daily_analysis['Daily_Downtime_Hours'])
+                )
                 if downtime_chart:
                     st.plotly_chart(downtime_chart, use_container_width=True)
                 else:
@@ -1394,14 +1733,14 @@ elif menu == "📤 Data Export":
     if df.empty:
         st.info("📭 No data available to export.")
     else:
+        # Summary data shared by the export options and the statistics column
+        summary_data = build_comprehensive_summary(df)
+
         col1, col2 = st.columns(2)
-        
+
         with col1:
             st.markdown("### 📊 Export Options")
-            
-            # Summary Data
-            summary_data = build_comprehensive_summary(df)
-            
+
             # Excel Export Options
             st.markdown("#### 📊 Excel Reports")
             
@@ -1416,7 +1755,7 @@ elif menu == "📤 Data Export":
                         ytd_df.to_excel(writer, sheet_name='YTD_Summary', index=False)
                         
                         # All outage records sheet (matching PDF)
-                        df_formatted = df.copy()
+                        df_formatted = drop_helper_columns(df)
                         df_formatted['Date'] = df_formatted['Date'].dt.strftime('%Y-%m-%d')
                         df_formatted.to_excel(writer, sheet_name='All_Outage_Records', index=False)
                     
@@ -1441,8 +1780,8 @@ elif menu == "📤 Data Export":
                     
                     # Filter outages for the latest month (matching PDF)
                     latest_month_outages = df[
-                        (df['Date'].dt.year == latest_year) & 
-                        (df['Date'].dt.strftime('%B') == latest_month_name)
+                        (df['Year'] == latest_year) &
+                        (df['Month'] == latest_month_name)
                     ].copy()
                     
                     # Create Excel file with latest month performance
@@ -1452,7 +1791,7 @@ elif menu == "📤 Data Export":
                         latest_month_df.to_excel(writer, sheet_name='Latest_Month', index=False)
                         
                         # All outages from latest month sheet (matching PDF)
-                        latest_month_outages_formatted = latest_month_outages.copy()
+                        latest_month_outages_formatted = drop_helper_columns(latest_month_outages)
                         latest_month_outages_formatted['Date'] = latest_month_outages_formatted['Date'].dt.strftime('%Y-%m-%d')
                         latest_month_outages_formatted.to_excel(writer, sheet_name=f'Outages_{latest_month_name}_{latest_year}', index=False)
                         
@@ -1474,7 +1813,7 @@ elif menu == "📤 Data Export":
                 output = BytesIO()
                 with pd.ExcelWriter(output, engine='openpyxl') as writer:
                     # All outage records (matching PDF)
-                    df_formatted = df.copy()
+                    df_formatted = drop_helper_columns(df)
                     df_formatted['Date'] = df_formatted['Date'].dt.strftime('%Y-%m-%d')
                     df_formatted.to_excel(writer, sheet_name='All_Outage_Records', index=False)
                     
@@ -1509,12 +1848,12 @@ elif menu == "📤 Data Export":
                 try:
                     # Create CSV with YTD summary and all records
                     ytd_df = pd.DataFrame([summary_data['ytd']])
-                    df_formatted = df.copy()
+                    df_formatted = drop_helper_columns(df)
                     df_formatted['Date'] = df_formatted['Date'].dt.strftime('%Y-%m-%d')
                     
                     # Combine YTD summary and all records
                     combined_data = pd.concat([ytd_df, df_formatted], ignore_index=True)
-                    csv_data = combined_data.to_csv(index=False)
+                    csv_data = csv_bytes(combined_data)
                     
                     st.download_button(
                         label="📥 Download YTD Summary (CSV)",
@@ -1535,15 +1874,15 @@ elif menu == "📤 Data Export":
                     latest_month_name = latest_month['Month']
                     
                     # Filter outages for the latest month
-                    latest_month_outages = df[
-                        (df['Date'].dt.year == latest_year) & 
-                        (df['Date'].dt.strftime('%B') == latest_month_name)
-                    ].copy()
+                    latest_month_outages = drop_helper_columns(df[
+                        (df['Year'] == latest_year) &
+                        (df['Month'] == latest_month_name)
+                    ])
                     latest_month_outages['Date'] = latest_month_outages['Date'].dt.strftime('%Y-%m-%d')
                     
                     # Combine month summary and month outages
                     combined_data = pd.concat([latest_month_df, latest_month_outages], ignore_index=True)
-                    csv_data = combined_data.to_csv(index=False)
+                    csv_data = csv_bytes(combined_data)
                     
                     st.download_button(
                         label="📥 Download Month to Date Performance (CSV)",
@@ -1556,9 +1895,9 @@ elif menu == "📤 Data Export":
             
             # Complete Report CSV
             try:
-                df_formatted = df.copy()
+                df_formatted = drop_helper_columns(df)
                 df_formatted['Date'] = df_formatted['Date'].dt.strftime('%Y-%m-%d')
-                csv_data = df_formatted.to_csv(index=False)
+                csv_data = csv_bytes(df_formatted)
                 
                 st.download_button(
                     label="📥 Download Complete Report (CSV)",
@@ -1577,7 +1916,6 @@ elif menu == "📤 Data Export":
             st.metric("Average Downtime", f"{df['Downtime (minutes)'].mean():.1f} minutes")
             
             # Add YTD statistics if available
-            summary_data = build_comprehensive_summary(df)
             ytd_summary = summary_data['ytd']
             if ytd_summary:
                 st.markdown("### 🎯 Year-to-Date Statistics")
@@ -1587,7 +1925,8 @@ elif menu == "📤 Data Export":
                 st.metric("YTD Downtime", f"{ytd_summary['total_downtime_minutes'] / 60:.1f}h")
             
             st.markdown("### 🔧 Failure Types")
-            failure_counts = df['Failure Type'].value_counts()
-            for failure_type, count in failure_counts.items():
-                st.write(f"• **{failure_type}**: {count} occurrences")
+            st.dataframe(
+                summary_data['failure_counts'].rename('Occurrences'),
+                use_container_width=True
+            )
 